@@ -4,17 +4,45 @@
 # Email Configuration - Brevo SMTP
 # Use environment variables for security
 import os
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 
-EMAIL_CONFIG = {
-    'service': 'brevo',
-    'username': os.getenv('BREVO_SMTP_LOGIN', ''),
-    'password': os.getenv('BREVO_SMTP_KEY', ''),
-    'smtp_server': os.getenv('BREVO_SMTP_HOST', 'smtp-relay.brevo.com'),
-    'smtp_port': int(os.getenv('BREVO_SMTP_PORT', '587')),
-    'from_email': os.getenv('FROM_EMAIL', 'hello@firstcityfoundry.com'),
-    'from_name': 'First City Foundry',
-    'use_tls': True
-}
+_env = os.environ
+
+
+@lru_cache(maxsize=1)
+def _load_email_config():
+    """Read the Brevo SMTP settings from the environment once per process.
+
+    EMAIL_CONFIG is bound to the first result at import; use
+    reload_email_config() to pick up changed variables.
+    """
+    return MappingProxyType({
+        'service': 'brevo',
+        'username': _env.get('BREVO_SMTP_LOGIN', ''),
+        'password': _env.get('BREVO_SMTP_KEY', ''),
+        'smtp_server': _env.get('BREVO_SMTP_HOST', 'smtp-relay.brevo.com'),
+        'smtp_port': int(_env.get('BREVO_SMTP_PORT', '587')),
+        'from_email': _env.get('FROM_EMAIL', 'hello@firstcityfoundry.com'),
+        'from_name': 'First City Foundry',
+        'use_tls': True
+    })
+
+
+EMAIL_CONFIG = _load_email_config()
+
+
+def reload_email_config():
+    """Re-read the SMTP settings from the environment and rebind EMAIL_CONFIG.
+
+    Modules that did `from config import EMAIL_CONFIG` keep their old copy
+    and should use the returned mapping instead.
+    """
+    global EMAIL_CONFIG
+    _load_email_config.cache_clear()
+    EMAIL_CONFIG = _load_email_config()
+    return EMAIL_CONFIG
 
 # SendGrid Configuration (Alternative)
 SENDGRID_CONFIG = {
@@ -24,13 +52,13 @@ SENDGRID_CONFIG = {
 }
 
 # Rate Limiting
-RATE_LIMITS = {
-    'min_delay': 30,  # Minimum seconds between requests
-    'max_delay': 60,  # Maximum seconds between requests
-    'max_daily_outreach': 50,  # Maximum emails per day
+RATE_LIMITS = MappingProxyType({
+    'rate_per_second': 10,  # Sustained email send rate (token refill); 0 disables pacing
+    'burst': 25,  # Emails that may go out back-to-back before throttling
+    'daily_cap': 50,  # Maximum emails per day
     'max_per_organization': 4,  # Maximum contacts per organization
     'min_per_organization': 2   # Minimum contacts per organization
-}
+})
 
 # Search API Configuration (Optional)
 SEARCH_CONFIG = {
@@ -41,37 +69,47 @@ SEARCH_CONFIG = {
 }
 
 # Site Information
-SITE_CONFIG = {
-    'name': 'First City Foundry',
-    'url': 'https://www.firstcityfoundry.com',
-    'contact_email': 'hello@firstcityfoundry.com',
-    'description': 'Portland-based startup foundry — AI tools, community, and structured support for solo founders',
-    'partners': ['Buildly', 'Kurent Co', 'Open.Build', 'Startup Grind PDX', 'Prepare4VC'],
-    'key_features': [
+@dataclass(frozen=True)
+class SiteConfig:
+    name: str
+    url: str
+    contact_email: str
+    description: str
+    partners: tuple
+    key_features: tuple
+
+
+SITE_CONFIG = SiteConfig(
+    name='First City Foundry',
+    url='https://www.firstcityfoundry.com',
+    contact_email='hello@firstcityfoundry.com',
+    description='Portland-based startup foundry — AI tools, community, and structured support for solo founders',
+    partners=('Buildly', 'Kurent Co', 'Open.Build', 'Startup Grind PDX', 'Prepare4VC'),
+    key_features=(
         'AI-powered startup analysis via the VMI Index',
         'Structured founder-to-CEO pathways',
         'Global partner ecosystem',
         'Portland Metro regional focus',
         'Free cloud hosting and developer tools'
-    ]
-}
+    )
+)
 
 # Logging Configuration
-LOGGING_CONFIG = {
+LOGGING_CONFIG = MappingProxyType({
     'level': 'INFO',
     'file': 'outreach.log',
     'max_file_size': '10MB',
     'backup_count': 5
-}
+})
 
 # Data Directories
-DATA_CONFIG = {
+DATA_CONFIG = MappingProxyType({
     'base_dir': 'outreach_data',
     'contacts_file': 'contacts.json',
     'targets_file': 'targets.json',
     'outreach_log_file': 'outreach_log.json',
     'analytics_file': 'analytics.json'
-}
+})
 
 # Advanced Features
 ADVANCED_CONFIG = {
@@ -6,10 +6,18 @@ Add New Targets Script
 Script to add new startup-focused targets to the outreach system.
 """
 
+import hashlib
 import json
+import logging
 import sys
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
+from logging.handlers import MemoryHandler
+from operator import attrgetter
+from urllib.parse import urlparse
 
 # Add parent directory to path to import startup_outreach
 current_dir = Path(__file__).parent
@@ -17,224 +25,111 @@ parent_dir = current_dir.parent
 sys.path.insert(0, str(parent_dir))
 sys.path.insert(0, str(current_dir))
 
-# Import directly from startup_outreach module
-from startup_outreach import OutreachTarget, StartupOutreachBot
+NEW_TARGETS_FILE = current_dir / "new_targets.json"
+TARGETS_FILE = parent_dir / "outreach_data" / "targets.json"
+# "<new_targets.json digest>:<targets.json mtime_ns>" as of the last completed run
+NEW_TARGETS_MARKER = parent_dir / "outreach_data" / "new_targets.cache"
+
+# Progress output is buffered and written to stdout in batches rather than line by line
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+logger.propagate = False
+output_handler = MemoryHandler(capacity=256, flushLevel=logging.ERROR,
+                               target=logging.StreamHandler(sys.stdout))
+logger.addHandler(output_handler)
+
+def load_new_targets():
+    """Read new_targets.json once and return (SHA-256 digest, raw target definitions) of those bytes"""
+    raw = NEW_TARGETS_FILE.read_bytes()
+    return hashlib.sha256(raw).hexdigest(), tuple(json.loads(raw))
+
+def targets_state(digest):
+    """Marker value tying a new_targets.json digest to the current targets.json"""
+    mtime = TARGETS_FILE.stat().st_mtime_ns if TARGETS_FILE.exists() else 0
+    return f"{digest}:{mtime}"
 
 def add_new_startup_targets():
     """Add new startup-focused targets to expand outreach reach"""
+    # Hash and parse the same bytes so the marker always describes the data merged
+    digest, new_targets = load_new_targets()
+    if NEW_TARGETS_MARKER.exists() and NEW_TARGETS_MARKER.read_text().strip() == targets_state(digest):
+        logger.info("new_targets.json and targets.json unchanged since the last run - nothing to add")
+        output_handler.flush()
+        return
+    
+    # Imported here so loading this module doesn't pull in the whole bot
+    from startup_outreach import OutreachTarget, StartupOutreachBot
     
     # Initialize the bot
     bot = StartupOutreachBot()
     
-    # New targets focused on startups, solo founders, and developer entrepreneurship
-    new_targets = [
-        OutreachTarget(
-            name="Y Combinator Blog",
-            website="https://blog.ycombinator.com",
-            category="publication",
-            focus_areas=["startups", "funding", "accelerators", "entrepreneurship"],
-            contact_methods=["email", "contact_form"],
-            priority=5
-        ),
-        OutreachTarget(
-            name="Stripe Blog",
-            website="https://stripe.com/blog",
-            category="publication",
-            focus_areas=["fintech", "startups", "developers", "SaaS"],
-            contact_methods=["email", "contact_form"],
-            priority=4
-        ),
-        OutreachTarget(
-            name="a16z Blog",
-            website="https://a16z.com/blog",
-            category="publication",
-            focus_areas=["venture_capital", "startups", "AI", "enterprise"],
-            contact_methods=["email", "contact_form"],
-            priority=5
-        ),
-        OutreachTarget(
-            name="Founder Stories",
-            website="https://founderstories.org",
-            category="publication",
-            focus_areas=["founder_stories", "entrepreneurship", "startups"],
-            contact_methods=["email", "contact_form"],
-            priority=4
-        ),
-        OutreachTarget(
-            name="SaaStr",
-            website="https://saastr.com",
-            category="community",
-            focus_areas=["SaaS", "startups", "funding", "scaling"],
-            contact_methods=["email", "platform_message"],
-            priority=5
-        ),
-        OutreachTarget(
-            name="Foundr Magazine",
-            website="https://foundr.com",
-            category="publication",
-            focus_areas=["entrepreneurship", "startups", "business", "solo_founders"],
-            contact_methods=["email", "contact_form"],
-            priority=4
-        ),
-        OutreachTarget(
-            name="NoCode Founders",
-            website="https://nocodefounders.com",
-            category="community",
-            focus_areas=["no_code", "solo_founders", "indie_makers", "bootstrapping"],
-            contact_methods=["email", "platform_message"],
-            priority=4
-        ),
-        OutreachTarget(
-            name="Maker Mag",
-            website="https://makermag.com",
-            category="publication",
-            focus_areas=["indie_makers", "solo_founders", "product_development"],
-            contact_methods=["email", "contact_form"],
-            priority=4
-        ),
-        OutreachTarget(
-            name="RemoteOK Blog",
-            website="https://remoteok.io/blog",
-            category="publication",
-            focus_areas=["remote_work", "startups", "developers", "entrepreneurs"],
-            contact_methods=["email", "contact_form"],
-            priority=3
-        ),
-        OutreachTarget(
-            name="Nomad List",
-            website="https://nomadlist.com",
-            category="community",
-            focus_areas=["digital_nomads", "remote_entrepreneurs", "startups"],
-            contact_methods=["platform_message", "email"],
-            priority=3
-        ),
-        OutreachTarget(
-            name="Startup Grind Global",
-            website="https://startupgrind.com/blog",
-            category="publication",
-            focus_areas=["startups", "entrepreneurship", "community", "events"],
-            contact_methods=["email", "contact_form"],
-            priority=4
-        ),
-        OutreachTarget(
-            name="Mind the Product",
-            website="https://mindtheproduct.com",
-            category="publication",
-            focus_areas=["product_management", "startups", "tech", "innovation"],
-            contact_methods=["email", "contact_form"],
-            priority=4
-        ),
-        OutreachTarget(
-            name="The Hustle",
-            website="https://thehustle.co",
-            category="publication",
-            focus_areas=["business", "startups", "entrepreneurship", "trends"],
-            contact_methods=["email", "contact_form"],
-            priority=4
-        ),
-        OutreachTarget(
-            name="Substack",
-            website="https://substack.com",
-            category="platform",
-            focus_areas=["creators", "newsletters", "indie_creators", "writers"],
-            contact_methods=["platform_message", "email"],
-            priority=3
-        ),
-        OutreachTarget(
-            name="Built In",
-            website="https://builtin.com",
-            category="publication",
-            focus_areas=["tech", "startups", "careers", "innovation"],
-            contact_methods=["email", "contact_form"],
-            priority=4
-        ),
-        OutreachTarget(
-            name="Fast Company",
-            website="https://fastcompany.com",
-            category="publication",
-            focus_areas=["innovation", "startups", "business", "technology"],
-            contact_methods=["email", "contact_form"],
-            priority=4
-        ),
-        OutreachTarget(
-            name="TechStars Blog",
-            website="https://techstars.com/blog",
-            category="publication",
-            focus_areas=["startups", "accelerators", "funding", "mentorship"],
-            contact_methods=["email", "contact_form"],
-            priority=5
-        ),
-        OutreachTarget(
-            name="AngelList Blog",
-            website="https://angel.co/blog",
-            category="publication",
-            focus_areas=["startups", "funding", "venture_capital", "jobs"],
-            contact_methods=["email", "platform_message"],
-            priority=5
-        ),
-        OutreachTarget(
-            name="Crunchbase News",
-            website="https://news.crunchbase.com",
-            category="publication",
-            focus_areas=["startups", "funding", "venture_capital", "M&A"],
-            contact_methods=["email", "contact_form"],
-            priority=5
-        ),
-        OutreachTarget(
-            name="Hacker Noon",
-            website="https://hackernoon.com",
-            category="publication",
-            focus_areas=["tech", "startups", "programming", "entrepreneurship"],
-            contact_methods=["email", "platform_message"],
-            priority=4
-        )
-    ]
-    
     # Filter out targets that already exist
-    existing_websites = {target.website for target in bot.targets}
-    unique_targets = [t for t in new_targets if t.website not in existing_websites]
+    existing_websites = set(map(attrgetter('website'), bot.targets))
+    # Key by website so duplicates within the batch collapse too
+    by_site = {data['website']: data for data in new_targets}
+    missing = by_site.keys() - existing_websites
+    # Only build OutreachTarget objects for the records that survive the filter
+    unique_targets = [OutreachTarget(**data) for site, data in by_site.items() if site in missing]
     
-    print(f"Found {len(unique_targets)} new targets to add (out of {len(new_targets)} total)")
+    logger.info(f"Found {len(unique_targets)} new targets to add (out of {len(new_targets)} total)")
     
     if unique_targets:
         # Add new targets
         bot.targets.extend(unique_targets)
-        bot.save_targets()
         
-        print("✅ Added new targets:")
+        logger.info("✅ Added new targets:")
         for target in unique_targets:
-            print(f"  • {target.name} ({target.website})")
+            logger.info(f"  • {target.name} ({target.website})")
             
-        print(f"\n🎯 Total targets now: {len(bot.targets)}")
+        logger.info(f"\n🎯 Total targets now: {len(bot.targets)}")
         
         # Immediately try to scrape contacts from new targets
-        print("\n🔍 Starting contact discovery for new targets...")
+        logger.info("\n🔍 Starting contact discovery for new targets...")
         
-        for target in unique_targets[:5]:  # Limit to first 5 to avoid rate limits
-            try:
-                print(f"\nScraping {target.name}...")
-                new_contacts = bot.scrape_contacts_from_target(target)
-                
-                # Add new contacts (avoid duplicates)
-                existing_emails = {contact.email for contact in bot.contacts}
-                unique_contacts = [c for c in new_contacts if c.email not in existing_emails]
-                
-                bot.contacts.extend(unique_contacts)
-                print(f"  ✅ Added {len(unique_contacts)} new contacts from {target.name}")
-                
-                # Rate limiting
-                import time, random
-                time.sleep(random.uniform(10, 20))
-                
-            except Exception as e:
-                print(f"  ❌ Error scraping {target.name}: {e}")
+        existing_emails = set(map(attrgetter('email'), bot.contacts))
         
-        # Save updated contacts
+        # Scrape targets concurrently; the per-domain lock keeps each host
+        # at one scrape at a time
+        domain_locks = defaultdict(threading.Lock)
+        
+        def scrape(target):
+            with domain_locks[urlparse(target.website).netloc]:
+                return bot.scrape_contacts_from_target(target)
+        
+        scrape_targets = unique_targets[:5]  # Limit to first 5 to avoid rate limits
+        with ThreadPoolExecutor(max_workers=len(scrape_targets)) as executor:
+            futures = {}
+            for target in scrape_targets:
+                logger.info(f"Scraping {target.name}...")
+                futures[executor.submit(scrape, target)] = target
+            # Show progress so far before waiting on the network
+            output_handler.flush()
+            
+            for future in as_completed(futures):
+                target = futures[future]
+                try:
+                    new_contacts = future.result()
+                    
+                    # Add new contacts (avoid duplicates)
+                    unique_contacts = [c for c in new_contacts if c.email not in existing_emails]
+                    existing_emails.update(c.email for c in unique_contacts)
+                    
+                    bot.contacts.extend(unique_contacts)
+                    logger.info(f"  ✅ Added {len(unique_contacts)} new contacts from {target.name}")
+                    
+                except Exception as e:
+                    logger.error(f"  ❌ Error scraping {target.name}: {e}")
+        
+        # Append the new targets (with their scrape stats) and save contacts
+        bot.append_targets(unique_targets)
         bot.save_contacts()
-        print(f"\n📊 Total contacts now: {len(bot.contacts)}")
+        logger.info(f"\n📊 Total contacts now: {len(bot.contacts)}")
         
     else:
-        print("No new targets to add - all targets already exist")
+        logger.info("No new targets to add - all targets already exist")
+    
+    NEW_TARGETS_MARKER.write_text(targets_state(digest))
+    output_handler.flush()
 
 if __name__ == "__main__":
     add_new_startup_targets()
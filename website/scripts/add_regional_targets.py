@@ -7,572 +7,252 @@ Adds smaller regional publications, angel groups, incubators, and accelerators
 from around the world to expand outreach beyond major US platforms.
 """
 
+import hashlib
 import json
 import os
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 
+# Optional faster JSON parser/serializer
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _target(name, website, category, focus_areas, contact_methods, priority, region):
+    """Build one regional target record"""
+    return {
+        "name": name,
+        "website": website,
+        "category": category,
+        "focus_areas": focus_areas,
+        "contact_methods": contact_methods,
+        "priority": priority,
+        "region": region
+    }
+
+# Built once at import; entries are shared, so copy before mutating
+_REGIONAL_TARGETS = (
+    # EUROPEAN STARTUP ECOSYSTEM
+    _target("TechEU", "https://tech.eu", "publication",
+            ["European startups", "funding", "tech"], ["email", "contact_form"], 4, "Europe"),
+    _target("EU-Startups", "https://www.eu-startups.com", "publication",
+            ["European startups", "funding", "events"], ["email", "contact_form"], 4, "Europe"),
+    _target("Tech.eu", "https://tech.eu", "publication",
+            ["European tech", "startups", "funding"], ["email", "twitter"], 4, "Europe"),
+    _target("Sifted", "https://sifted.eu", "publication",
+            ["European startups", "VC", "tech"], ["email", "contact_form"], 4, "Europe"),
+    _target("Rocket Internet", "https://www.rocket-internet.com", "platform",
+            ["incubator", "global startups", "scaling"], ["email", "contact_form"], 3, "Europe"),
+    
+    # UK SPECIFIC
+    _target("TechCityNews", "https://techcitynews.com", "publication",
+            ["UK startups", "fintech", "tech"], ["email", "contact_form"], 4, "UK"),
+    _target("UKTech.news", "https://uktech.news", "publication",
+            ["UK tech", "startups", "investment"], ["email", "twitter"], 4, "UK"),
+    _target("Techround", "https://techround.co.uk", "publication",
+            ["UK startups", "tech news", "entrepreneurship"], ["email", "contact_form"], 4, "UK"),
+    _target("Seedcamp", "https://seedcamp.com", "platform",
+            ["European accelerator", "early stage", "mentorship"], ["email", "contact_form"], 4, "UK"),
+    _target("Techstars London", "https://www.techstars.com/accelerators/london", "platform",
+            ["accelerator", "mentorship", "funding"], ["email", "contact_form"], 4, "UK"),
+    
+    # GERMANY
+    _target("Deutsche Startups", "https://www.deutsche-startups.de", "publication",
+            ["German startups", "funding", "ecosystem"], ["email", "contact_form"], 4, "Germany"),
+    _target("Gruenderszene", "https://www.gruenderszene.de", "publication",
+            ["German startups", "entrepreneurship", "investment"], ["email", "contact_form"], 4, "Germany"),
+    _target("Rocket Internet", "https://www.rocket-internet.com", "platform",
+            ["global incubator", "scaling", "international"], ["email", "contact_form"], 3, "Germany"),
+    
+    # FRANCE
+    _target("Maddyness", "https://www.maddyness.com", "publication",
+            ["French startups", "innovation", "tech"], ["email", "contact_form"], 4, "France"),
+    _target("Frenchweb", "https://www.frenchweb.fr", "publication",
+            ["French tech", "startups", "digital"], ["email", "twitter"], 4, "France"),
+    _target("Station F", "https://stationf.co", "platform",
+            ["startup campus", "incubator", "French ecosystem"], ["email", "contact_form"], 4, "France"),
+    
+    # NETHERLANDS
+    _target("StartupJuncture", "https://startupjuncture.com", "publication",
+            ["Dutch startups", "ecosystem", "innovation"], ["email", "contact_form"], 4, "Netherlands"),
+    _target("Rockstart", "https://www.rockstart.com", "platform",
+            ["accelerator", "early stage", "global"], ["email", "contact_form"], 4, "Netherlands"),
+    
+    # NORDIC COUNTRIES
+    _target("Arctic Startup", "https://arcticstartup.com", "publication",
+            ["Nordic startups", "ecosystem", "funding"], ["email", "contact_form"], 4, "Nordic"),
+    _target("Nordic Startup News", "https://nordicstartupnews.com", "publication",
+            ["Nordic ecosystem", "startups", "investment"], ["email", "twitter"], 4, "Nordic"),
+    _target("Startup Norway", "https://startupnorway.com", "publication",
+            ["Norwegian startups", "ecosystem", "innovation"], ["email", "contact_form"], 4, "Norway"),
+    
+    # ASIA-PACIFIC
+    _target("TechNode", "https://technode.com", "publication",
+            ["Chinese tech", "startups", "innovation"], ["email", "contact_form"], 4, "China"),
+    _target("KrAsia", "https://kr-asia.com", "publication",
+            ["Asian startups", "investment", "tech"], ["email", "contact_form"], 4, "Asia"),
+    _target("TechInAsia", "https://www.techinasia.com", "publication",
+            ["Asian tech", "startups", "funding"], ["email", "contact_form"], 4, "Asia"),
+    _target("StartupAsia", "https://www.startupasia.org", "platform",
+            ["Asian startups", "ecosystem", "events"], ["email", "contact_form"], 4, "Asia"),
+    
+    # JAPAN
+    _target("The Bridge", "https://thebridge.jp", "publication",
+            ["Japanese startups", "tech", "innovation"], ["email", "contact_form"], 4, "Japan"),
+    _target("TechCrunch Japan", "https://jp.techcrunch.com", "publication",
+            ["Japanese tech", "startups", "global"], ["email", "contact_form"], 4, "Japan"),
+    
+    # SINGAPORE
+    _target("e27", "https://e27.co", "publication",
+            ["Southeast Asian startups", "ecosystem", "funding"], ["email", "contact_form"], 4, "Singapore"),
+    _target("Vulcan Post", "https://vulcanpost.com", "publication",
+            ["Southeast Asian tech", "startups", "innovation"], ["email", "contact_form"], 4, "Singapore"),
+    
+    # AUSTRALIA
+    _target("StartupSmart", "https://www.startupsmart.com.au", "publication",
+            ["Australian startups", "entrepreneurship", "SME"], ["email", "contact_form"], 4, "Australia"),
+    _target("Startup Daily", "https://www.startupdaily.net", "publication",
+            ["Australian tech", "startups", "innovation"], ["email", "contact_form"], 4, "Australia"),
+    
+    # CANADA
+    _target("BetaKit", "https://betakit.com", "publication",
+            ["Canadian startups", "tech", "innovation"], ["email", "contact_form"], 4, "Canada"),
+    _target("MobileSyrup", "https://mobilesyrup.com", "publication",
+            ["Canadian tech", "mobile", "startups"], ["email", "contact_form"], 4, "Canada"),
+    _target("Techvibes", "https://techvibes.com", "publication",
+            ["Canadian tech", "startups", "ecosystem"], ["email", "contact_form"], 4, "Canada"),
+    
+    # LATIN AMERICA
+    _target("LAVCA", "https://lavca.org", "platform",
+            ["Latin American VC", "startups", "investment"], ["email", "contact_form"], 4, "Latin America"),
+    _target("Contxto", "https://www.contxto.com", "publication",
+            ["Latin American startups", "ecosystem", "funding"], ["email", "contact_form"], 4, "Latin America"),
+    _target("ABVCAP", "https://www.abvcap.com.br", "platform",
+            ["Brazilian VC", "startups", "private equity"], ["email", "contact_form"], 4, "Brazil"),
+    
+    # MIDDLE EAST & AFRICA
+    _target("Wamda", "https://www.wamda.com", "publication",
+            ["MENA startups", "entrepreneurship", "investment"], ["email", "contact_form"], 4, "MENA"),
+    _target("Magnitt", "https://magnitt.com", "platform",
+            ["MENA startups", "funding", "ecosystem"], ["email", "contact_form"], 4, "MENA"),
+    _target("Disrupt Africa", "https://disrupt-africa.com", "publication",
+            ["African startups", "tech", "investment"], ["email", "contact_form"], 4, "Africa"),
+    
+    # ACCELERATORS & INCUBATORS WORLDWIDE
+    _target("Founder Institute", "https://fi.co", "platform",
+            ["global accelerator", "pre-seed", "mentorship"], ["email", "contact_form"], 5, "Global"),
+    _target("SOSV", "https://sosv.com", "platform",
+            ["global VC", "accelerator", "deep tech"], ["email", "contact_form"], 4, "Global"),
+    _target("Antler", "https://antler.co", "platform",
+            ["global VC", "early stage", "founder matching"], ["email", "contact_form"], 4, "Global"),
+    _target("Plug and Play", "https://plugandplaytechcenter.com", "platform",
+            ["corporate accelerator", "innovation", "global"], ["email", "contact_form"], 4, "Global"),
+    _target("APX", "https://apx.ac", "platform",
+            ["European accelerator", "early stage", "Porsche Digital"], ["email", "contact_form"], 4, "Europe"),
+    _target("BEAM", "https://beam.camp", "platform",
+            ["European accelerator", "sustainability", "impact"], ["email", "contact_form"], 4, "Europe"),
+    
+    # ANGEL GROUPS & NETWORKS
+    _target("Angel Investment Network", "https://www.angelinvestmentnetwork.co.uk", "platform",
+            ["angel investing", "early stage", "global"], ["email", "contact_form"], 4, "Global"),
+    _target("European Business Angels Network", "https://www.eban.org", "platform",
+            ["European angels", "investment", "ecosystem"], ["email", "contact_form"], 4, "Europe"),
+    _target("French Business Angels", "https://www.franceangels.org", "platform",
+            ["French angels", "investment", "mentorship"], ["email", "contact_form"], 4, "France"),
+    
+    # REGIONAL STARTUP COMMUNITIES
+    _target("Silicon Canals", "https://siliconcanals.com", "publication",
+            ["European tech", "startups", "ecosystem"], ["email", "contact_form"], 4, "Europe"),
+    _target("Startup Lithuania", "https://www.startuplithuania.lt", "platform",
+            ["Lithuanian startups", "ecosystem", "fintech"], ["email", "contact_form"], 4, "Lithuania"),
+    _target("Startup Estonia", "https://startupestonia.ee", "platform",
+            ["Estonian startups", "digital", "e-residency"], ["email", "contact_form"], 4, "Estonia"),
+    _target("Swiss Startup", "https://www.swissstartup.org", "platform",
+            ["Swiss startups", "ecosystem", "innovation"], ["email", "contact_form"], 4, "Switzerland"),
+    _target("Austria Startups", "https://austriastartups.com", "platform",
+            ["Austrian startups", "ecosystem", "community"], ["email", "contact_form"], 4, "Austria")
+)
+
 def get_regional_targets():
-    """Return comprehensive list of regional and international targets"""
-    return [
-        # EUROPEAN STARTUP ECOSYSTEM
-        {
-            "name": "TechEU",
-            "website": "https://tech.eu",
-            "category": "publication",
-            "focus_areas": ["European startups", "funding", "tech"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Europe"
-        },
-        {
-            "name": "EU-Startups",
-            "website": "https://www.eu-startups.com",
-            "category": "publication", 
-            "focus_areas": ["European startups", "funding", "events"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Europe"
-        },
-        {
-            "name": "Tech.eu",
-            "website": "https://tech.eu",
-            "category": "publication",
-            "focus_areas": ["European tech", "startups", "funding"],
-            "contact_methods": ["email", "twitter"],
-            "priority": 4,
-            "region": "Europe"
-        },
-        {
-            "name": "Sifted",
-            "website": "https://sifted.eu",
-            "category": "publication",
-            "focus_areas": ["European startups", "VC", "tech"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Europe"
-        },
-        {
-            "name": "Rocket Internet",
-            "website": "https://www.rocket-internet.com",
-            "category": "platform",
-            "focus_areas": ["incubator", "global startups", "scaling"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 3,
-            "region": "Europe"
-        },
-        
-        # UK SPECIFIC
-        {
-            "name": "TechCityNews",
-            "website": "https://techcitynews.com",
-            "category": "publication",
-            "focus_areas": ["UK startups", "fintech", "tech"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "UK"
-        },
-        {
-            "name": "UKTech.news",
-            "website": "https://uktech.news",
-            "category": "publication",
-            "focus_areas": ["UK tech", "startups", "investment"],
-            "contact_methods": ["email", "twitter"],
-            "priority": 4,
-            "region": "UK"
-        },
-        {
-            "name": "Techround",
-            "website": "https://techround.co.uk",
-            "category": "publication",
-            "focus_areas": ["UK startups", "tech news", "entrepreneurship"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "UK"
-        },
-        {
-            "name": "Seedcamp",
-            "website": "https://seedcamp.com",
-            "category": "platform",
-            "focus_areas": ["European accelerator", "early stage", "mentorship"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "UK"
-        },
-        {
-            "name": "Techstars London",
-            "website": "https://www.techstars.com/accelerators/london",
-            "category": "platform", 
-            "focus_areas": ["accelerator", "mentorship", "funding"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "UK"
-        },
-        
-        # GERMANY
-        {
-            "name": "Deutsche Startups",
-            "website": "https://www.deutsche-startups.de",
-            "category": "publication",
-            "focus_areas": ["German startups", "funding", "ecosystem"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Germany"
-        },
-        {
-            "name": "Gruenderszene",
-            "website": "https://www.gruenderszene.de",
-            "category": "publication",
-            "focus_areas": ["German startups", "entrepreneurship", "investment"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Germany"
-        },
-        {
-            "name": "Rocket Internet",
-            "website": "https://www.rocket-internet.com",
-            "category": "platform",
-            "focus_areas": ["global incubator", "scaling", "international"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 3,
-            "region": "Germany"
-        },
-        
-        # FRANCE
-        {
-            "name": "Maddyness",
-            "website": "https://www.maddyness.com",
-            "category": "publication",
-            "focus_areas": ["French startups", "innovation", "tech"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "France"
-        },
-        {
-            "name": "Frenchweb",
-            "website": "https://www.frenchweb.fr",
-            "category": "publication",
-            "focus_areas": ["French tech", "startups", "digital"],
-            "contact_methods": ["email", "twitter"],
-            "priority": 4,
-            "region": "France"
-        },
-        {
-            "name": "Station F",
-            "website": "https://stationf.co",
-            "category": "platform",
-            "focus_areas": ["startup campus", "incubator", "French ecosystem"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "France"
-        },
-        
-        # NETHERLANDS
-        {
-            "name": "StartupJuncture",
-            "website": "https://startupjuncture.com",
-            "category": "publication",
-            "focus_areas": ["Dutch startups", "ecosystem", "innovation"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Netherlands"
-        },
-        {
-            "name": "Rockstart",
-            "website": "https://www.rockstart.com",
-            "category": "platform",
-            "focus_areas": ["accelerator", "early stage", "global"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Netherlands"
-        },
-        
-        # NORDIC COUNTRIES
-        {
-            "name": "Arctic Startup",
-            "website": "https://arcticstartup.com",
-            "category": "publication",
-            "focus_areas": ["Nordic startups", "ecosystem", "funding"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Nordic"
-        },
-        {
-            "name": "Nordic Startup News",
-            "website": "https://nordicstartupnews.com",
-            "category": "publication",
-            "focus_areas": ["Nordic ecosystem", "startups", "investment"],
-            "contact_methods": ["email", "twitter"],
-            "priority": 4,
-            "region": "Nordic"
-        },
-        {
-            "name": "Startup Norway",
-            "website": "https://startupnorway.com",
-            "category": "publication",
-            "focus_areas": ["Norwegian startups", "ecosystem", "innovation"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Norway"
-        },
-        
-        # ASIA-PACIFIC
-        {
-            "name": "TechNode",
-            "website": "https://technode.com",
-            "category": "publication",
-            "focus_areas": ["Chinese tech", "startups", "innovation"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "China"
-        },
-        {
-            "name": "KrAsia",
-            "website": "https://kr-asia.com",
-            "category": "publication",
-            "focus_areas": ["Asian startups", "investment", "tech"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Asia"
-        },
-        {
-            "name": "TechInAsia",
-            "website": "https://www.techinasia.com",
-            "category": "publication",
-            "focus_areas": ["Asian tech", "startups", "funding"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Asia"
-        },
-        {
-            "name": "StartupAsia",
-            "website": "https://www.startupasia.org",
-            "category": "platform",
-            "focus_areas": ["Asian startups", "ecosystem", "events"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Asia"
-        },
-        
-        # JAPAN
-        {
-            "name": "The Bridge",
-            "website": "https://thebridge.jp",
-            "category": "publication",
-            "focus_areas": ["Japanese startups", "tech", "innovation"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Japan"
-        },
-        {
-            "name": "TechCrunch Japan",
-            "website": "https://jp.techcrunch.com",
-            "category": "publication",
-            "focus_areas": ["Japanese tech", "startups", "global"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Japan"
-        },
-        
-        # SINGAPORE
-        {
-            "name": "e27",
-            "website": "https://e27.co",
-            "category": "publication",
-            "focus_areas": ["Southeast Asian startups", "ecosystem", "funding"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Singapore"
-        },
-        {
-            "name": "Vulcan Post",
-            "website": "https://vulcanpost.com",
-            "category": "publication",
-            "focus_areas": ["Southeast Asian tech", "startups", "innovation"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Singapore"
-        },
-        
-        # AUSTRALIA
-        {
-            "name": "StartupSmart",
-            "website": "https://www.startupsmart.com.au",
-            "category": "publication",
-            "focus_areas": ["Australian startups", "entrepreneurship", "SME"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Australia"
-        },
-        {
-            "name": "Startup Daily",
-            "website": "https://www.startupdaily.net",
-            "category": "publication",
-            "focus_areas": ["Australian tech", "startups", "innovation"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Australia"
-        },
-        
-        # CANADA
-        {
-            "name": "BetaKit",
-            "website": "https://betakit.com",
-            "category": "publication",
-            "focus_areas": ["Canadian startups", "tech", "innovation"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Canada"
-        },
-        {
-            "name": "MobileSyrup",
-            "website": "https://mobilesyrup.com",
-            "category": "publication",
-            "focus_areas": ["Canadian tech", "mobile", "startups"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Canada"
-        },
-        {
-            "name": "Techvibes",
-            "website": "https://techvibes.com",
-            "category": "publication",
-            "focus_areas": ["Canadian tech", "startups", "ecosystem"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Canada"
-        },
-        
-        # LATIN AMERICA
-        {
-            "name": "LAVCA",
-            "website": "https://lavca.org",
-            "category": "platform",
-            "focus_areas": ["Latin American VC", "startups", "investment"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Latin America"
-        },
-        {
-            "name": "Contxto",
-            "website": "https://www.contxto.com",
-            "category": "publication",
-            "focus_areas": ["Latin American startups", "ecosystem", "funding"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Latin America"
-        },
-        {
-            "name": "ABVCAP",
-            "website": "https://www.abvcap.com.br",
-            "category": "platform",
-            "focus_areas": ["Brazilian VC", "startups", "private equity"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Brazil"
-        },
-        
-        # MIDDLE EAST & AFRICA
-        {
-            "name": "Wamda",
-            "website": "https://www.wamda.com",
-            "category": "publication",
-            "focus_areas": ["MENA startups", "entrepreneurship", "investment"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "MENA"
-        },
-        {
-            "name": "Magnitt",
-            "website": "https://magnitt.com",
-            "category": "platform",
-            "focus_areas": ["MENA startups", "funding", "ecosystem"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "MENA"
-        },
-        {
-            "name": "Disrupt Africa",
-            "website": "https://disrupt-africa.com",
-            "category": "publication",
-            "focus_areas": ["African startups", "tech", "investment"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Africa"
-        },
-        
-        # ACCELERATORS & INCUBATORS WORLDWIDE
-        {
-            "name": "Founder Institute",
-            "website": "https://fi.co",
-            "category": "platform",
-            "focus_areas": ["global accelerator", "pre-seed", "mentorship"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 5,
-            "region": "Global"
-        },
-        {
-            "name": "SOSV",
-            "website": "https://sosv.com",
-            "category": "platform",
-            "focus_areas": ["global VC", "accelerator", "deep tech"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Global"
-        },
-        {
-            "name": "Antler",
-            "website": "https://antler.co",
-            "category": "platform",
-            "focus_areas": ["global VC", "early stage", "founder matching"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Global"
-        },
-        {
-            "name": "Plug and Play",
-            "website": "https://plugandplaytechcenter.com",
-            "category": "platform",
-            "focus_areas": ["corporate accelerator", "innovation", "global"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Global"
-        },
-        {
-            "name": "APX",
-            "website": "https://apx.ac",
-            "category": "platform",
-            "focus_areas": ["European accelerator", "early stage", "Porsche Digital"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Europe"
-        },
-        {
-            "name": "BEAM",
-            "website": "https://beam.camp",
-            "category": "platform",
-            "focus_areas": ["European accelerator", "sustainability", "impact"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Europe"
-        },
-        
-        # ANGEL GROUPS & NETWORKS
-        {
-            "name": "Angel Investment Network",
-            "website": "https://www.angelinvestmentnetwork.co.uk",
-            "category": "platform",
-            "focus_areas": ["angel investing", "early stage", "global"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Global"
-        },
-        {
-            "name": "European Business Angels Network",
-            "website": "https://www.eban.org",
-            "category": "platform",
-            "focus_areas": ["European angels", "investment", "ecosystem"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Europe"
-        },
-        {
-            "name": "French Business Angels",
-            "website": "https://www.franceangels.org",
-            "category": "platform",
-            "focus_areas": ["French angels", "investment", "mentorship"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "France"
-        },
-        
-        # REGIONAL STARTUP COMMUNITIES
-        {
-            "name": "Silicon Canals",
-            "website": "https://siliconcanals.com",
-            "category": "publication",
-            "focus_areas": ["European tech", "startups", "ecosystem"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Europe"
-        },
-        {
-            "name": "Startup Lithuania",
-            "website": "https://www.startuplithuania.lt",
-            "category": "platform",
-            "focus_areas": ["Lithuanian startups", "ecosystem", "fintech"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Lithuania"
-        },
-        {
-            "name": "Startup Estonia",
-            "website": "https://startupestonia.ee",
-            "category": "platform",
-            "focus_areas": ["Estonian startups", "digital", "e-residency"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Estonia"
-        },
-        {
-            "name": "Swiss Startup",
-            "website": "https://www.swissstartup.org",
-            "category": "platform",
-            "focus_areas": ["Swiss startups", "ecosystem", "innovation"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Switzerland"
-        },
-        {
-            "name": "Austria Startups",
-            "website": "https://austriastartups.com",
-            "category": "platform",
-            "focus_areas": ["Austrian startups", "ecosystem", "community"],
-            "contact_methods": ["email", "contact_form"],
-            "priority": 4,
-            "region": "Austria"
-        }
-    ]
+    """Return comprehensive tuple of regional and international targets (shared, do not mutate)"""
+    return _REGIONAL_TARGETS
+
+def normalize_website(url):
+    """Reduce a URL to host and path for duplicate checks (no scheme, www. or trailing slash)"""
+    url = url.lower().rstrip('/').split('://', 1)[-1]
+    return url[4:] if url.startswith('www.') else url
+
+def merge_into(existing_targets):
+    """Append regional targets missing from existing_targets (in place); returns how many were added"""
+    lower = str.lower
+    existing_names = {lower(target['name']) for target in existing_targets if 'name' in target}
+    existing_sites = {normalize_website(target['website']) for target in existing_targets if 'website' in target}
+    
+    # Key additions by lowercased name so repeats in the regional list collapse (first wins);
+    # a target is also skipped when its website is already tracked under another name
+    additions = {}
+    for target in get_regional_targets():
+        name = lower(target['name'])
+        site = normalize_website(target['website'])
+        if name not in existing_names and name not in additions and site not in existing_sites:
+            additions[name] = {**target, 'contacts_found': 0, 'last_scraped': None}
+            existing_sites.add(site)
+    
+    existing_targets.extend(additions.values())
+    return len(additions)
 
 def add_regional_targets():
     """Add regional targets to the existing targets.json file"""
     data_dir = Path("outreach_data")
     targets_file = data_dir / "targets.json"
+    cache_file = data_dir / "regional.cache"
+    
+    # Skip the whole merge when neither the regional list nor targets.json
+    # has changed since the last run
+    digest = hashlib.sha256(json.dumps(_REGIONAL_TARGETS, sort_keys=True).encode()).hexdigest()
+    if targets_file.exists() and cache_file.exists():
+        if cache_file.read_text() == f"{digest}:{targets_file.stat().st_mtime_ns}":
+            print("Regional targets already up to date - nothing to add")
+            return
     
     # Load existing targets
     try:
-        with open(targets_file, 'r') as f:
-            existing_targets = json.load(f)
+        if orjson is not None:
+            existing_targets = orjson.loads(targets_file.read_bytes())
+        else:
+            with open(targets_file, 'r') as f:
+                existing_targets = json.load(f)
     except FileNotFoundError:
         existing_targets = []
     
-    # Get new regional targets
-    new_targets = get_regional_targets()
+    added_count = merge_into(existing_targets)
     
-    # Check which targets are new (avoid duplicates)
-    existing_names = {target.get('name', '').lower() for target in existing_targets}
-    added_count = 0
+    # One write for the whole list instead of a print per target
+    if added_count:
+        print("\n".join(f"✅ Added: {target['name']} ({target['region']})"
+                        for target in existing_targets[-added_count:]))
     
-    for target in new_targets:
-        if target['name'].lower() not in existing_names:
-            target['contacts_found'] = 0
-            target['last_scraped'] = None
-            existing_targets.append(target)
-            added_count += 1
-            print(f"✅ Added: {target['name']} ({target['region']})")
+    # Save updated targets (only when something was added); write a temp file
+    # and swap it in so a crash mid-write can't leave a truncated targets.json
+    if added_count:
+        tmp_file = targets_file.with_suffix('.json.tmp')
+        if orjson is not None:
+            tmp_file.write_bytes(orjson.dumps(existing_targets, option=orjson.OPT_INDENT_2))
+        else:
+            with open(tmp_file, 'w') as f:
+                json.dump(existing_targets, f, indent=2)
+        os.replace(tmp_file, targets_file)
     
-    # Save updated targets
-    with open(targets_file, 'w') as f:
-        json.dump(existing_targets, f, indent=2)
+    if targets_file.exists():
+        cache_file.write_text(f"{digest}:{targets_file.stat().st_mtime_ns}")
     
     print(f"\n🎯 Added {added_count} new regional targets")
     print(f"📊 Total targets now: {len(existing_targets)}")
     
     # Summary by region
-    regions = {}
-    for target in existing_targets:
-        region = target.get('region', 'US/Global')
-        regions[region] = regions.get(region, 0) + 1
+    regions = Counter(target.get('region', 'US/Global') for target in existing_targets)
     
     print("\n🌍 Targets by region:")
     for region, count in sorted(regions.items()):
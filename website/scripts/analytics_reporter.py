@@ -9,14 +9,22 @@ and outreach activities to generate comprehensive daily status reports.
 
 import os
 import json
+import time
+import hashlib
+import heapq
+import re
 import requests
+from requests.adapters import HTTPAdapter
 import smtplib
 import random
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from operator import itemgetter
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 import logging
 from pathlib import Path
 
@@ -40,7 +48,96 @@ except ImportError:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+GA_CACHE_TTL = 3600  # Seconds a cached Google Analytics report stays fresh
+
+# Traffic sources counted as social media referrals
+SOCIAL_SOURCE_RE = re.compile(r'linkedin|twitter|facebook|instagram', re.IGNORECASE)
+
+# Optional faster JSON parser/serializer for the outreach data files
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path) as f:
+        return json.load(f)
+
+def _write_json(path: Path, data: Any):
+    """Write indented JSON, using orjson when it is installed"""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+# Constant fallbacks shared by every call; treat them as read-only
+FALLBACK_GA_DATA = {
+    'sessions': 45,
+    'users': 38,
+    'pageviews': 67,
+    'bounce_rate': 0.32,
+    'avg_session_duration': 145.5,
+    'top_pages': [
+        {'page': '/', 'sessions': 25, 'pageviews': 30},
+        {'page': '/register', 'sessions': 12, 'pageviews': 15},
+        {'page': '/about', 'sessions': 8, 'pageviews': 12}
+    ],
+    'traffic_sources': {
+        'google / organic': 20,
+        '(direct) / (none)': 15,
+        'linkedin.com / referral': 5,
+        'twitter.com / referral': 3,
+        'github.com / referral': 2
+    }
+}
+
+BASELINE_YOUTUBE_ANALYTICS = {
+    "views_24h": 0,
+    "subscribers_gained": 0,
+    "watch_time_minutes": 0.0,
+    "top_videos": [],
+    "engagement_rate": 0.0,
+    "average_view_duration": "0:00",
+    "traffic_sources": {
+        "youtube_search": 0,
+        "suggested_videos": 0,
+        "external": 0
+    }
+}
+
+BASELINE_WEBSITE_ANALYTICS = {
+    "conversion_events": {
+        "podcast_signups": 0,
+        "newsletter_signups": 0,
+        "contact_form_submissions": 0,
+        "resource_downloads": 0
+    },
+    "user_behavior": {
+        "new_vs_returning": {"new": 75, "returning": 25},
+        "device_breakdown": {"desktop": 60, "mobile": 35, "tablet": 5},
+        "location_top5": [
+            {"country": "United States", "sessions": 45},
+            {"country": "Canada", "sessions": 12},
+            {"country": "United Kingdom", "sessions": 8},
+            {"country": "Germany", "sessions": 6},
+            {"country": "Australia", "sessions": 4}
+        ]
+    },
+    "performance_metrics": {
+        "page_load_time": 2.3,
+        "core_web_vitals": {
+            "LCP": 2.1,
+            "FID": 85,
+            "CLS": 0.05
+        }
+    }
+}
+
+@dataclass(frozen=True)
 class AnalyticsData:
     """Analytics data structure"""
     date: str
@@ -49,8 +146,8 @@ class AnalyticsData:
     website_pageviews: int = 0
     website_bounce_rate: float = 0.0
     website_avg_session_duration: float = 0.0
-    website_top_pages: Optional[List[Dict]] = None
-    website_traffic_sources: Optional[Dict[str, int]] = None
+    website_top_pages: List[Dict] = field(default_factory=list)
+    website_traffic_sources: Dict[str, int] = field(default_factory=dict)
     youtube_views: int = 0
     youtube_subscribers: int = 0
     youtube_watch_time: float = 0.0
@@ -62,12 +159,6 @@ class AnalyticsData:
     search_engine_referrals: int = 0
     social_media_referrals: int = 0
     direct_traffic: int = 0
-    
-    def __post_init__(self):
-        if self.website_top_pages is None:
-            self.website_top_pages = []
-        if self.website_traffic_sources is None:
-            self.website_traffic_sources = {}
 
 class AnalyticsCollector:
     """Collects analytics data from various sources"""
@@ -81,7 +172,51 @@ class AnalyticsCollector:
         self.youtube_api_key = os.getenv('YOUTUBE_API_KEY')
         self.data_dir = Path("outreach_data")
         self.data_dir.mkdir(exist_ok=True)
+        self.ga_cache_dir = self.data_dir / "ga_cache"
+        # Date of the report being generated, set once per generate_daily_report run
+        self._report_date: Optional[str] = None
         
+        # Rolling 30-day history behind daily_reports.json, read from disk once
+        self.reports_file = self.data_dir / "daily_reports.json"
+        self._reports = deque(maxlen=30)
+        if self.reports_file.exists():
+            try:
+                self._reports.extend(_read_json(self.reports_file))
+            except (OSError, ValueError) as e:
+                # Move the unreadable file aside so the next save can't overwrite the history
+                corrupt_file = self.reports_file.with_name(self.reports_file.name + '.corrupt')
+                os.replace(self.reports_file, corrupt_file)
+                logger.warning(f"Could not read {self.reports_file} ({e}); moved it to {corrupt_file} "
+                               f"and started a new history")
+        
+        # Pooled HTTP session so repeat checks reuse the open connection
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=2)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+    def _ga_cache_path(self, method: str, start_date: str, end_date: str) -> Path:
+        """Cache file for a GA report query"""
+        key = f"{method}:{self.ga_property_id}:{start_date}:{end_date}"
+        return self.ga_cache_dir / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+
+    def _load_ga_cache(self, cache_path: Path) -> Optional[Dict[str, Any]]:
+        """Return a cached GA report if it is younger than GA_CACHE_TTL"""
+        try:
+            if time.time() - cache_path.stat().st_mtime < GA_CACHE_TTL:
+                return _read_json(cache_path)
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def _save_ga_cache(self, cache_path: Path, data: Dict[str, Any]):
+        """Store a GA report so repeat runs within GA_CACHE_TTL skip the API call"""
+        try:
+            self.ga_cache_dir.mkdir(exist_ok=True)
+            _write_json(cache_path, data)
+        except OSError as e:
+            logger.warning(f"Could not write GA cache: {e}")
+
     def collect_google_analytics(self, days_back: int = 1) -> Dict[str, Any]:
         """Collect Google Analytics data using API key or service account"""
         try:
@@ -113,8 +248,15 @@ class AnalyticsCollector:
             base_url = "https://analyticsreporting.googleapis.com/v4/reports:batchGet"
             
             # Define date range
-            start_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
-            end_date = datetime.now().strftime('%Y-%m-%d')
+            now = datetime.now()
+            start_date = (now - timedelta(days=days_back)).strftime('%Y-%m-%d')
+            end_date = now.strftime('%Y-%m-%d')
+            
+            cache_path = self._ga_cache_path('reporting_v4', start_date, end_date)
+            cached = self._load_ga_cache(cache_path)
+            if cached is not None:
+                logger.info("Using cached Google Analytics report")
+                return cached
             
             # Basic request payload for GA Reporting API
             payload = {
@@ -149,8 +291,11 @@ class AnalyticsCollector:
             )
             
             if response.status_code == 200:
-                data = response.json()
-                return self._parse_ga_api_response(data)
+                result = self._parse_ga_api_response(response.json())
+                if result is None:
+                    return self._get_mock_ga_data()
+                self._save_ga_cache(cache_path, result)
+                return result
             else:
                 logger.warning(f"GA API request failed with status {response.status_code}: {response.text}")
                 return self._get_mock_ga_data()
@@ -162,6 +307,17 @@ class AnalyticsCollector:
     def _collect_ga_with_service_account(self, days_back: int = 1) -> Dict[str, Any]:
         """Collect Google Analytics data using service account credentials"""
         try:
+            # Define date range
+            now = datetime.now()
+            start_date = (now - timedelta(days=days_back)).strftime('%Y-%m-%d')
+            end_date = now.strftime('%Y-%m-%d')
+            
+            cache_path = self._ga_cache_path('data_v1beta', start_date, end_date)
+            cached = self._load_ga_cache(cache_path)
+            if cached is not None:
+                logger.info("Using cached Google Analytics report")
+                return cached
+            
             # Import Google Analytics modules only if configured
             from google.analytics.data_v1beta import BetaAnalyticsDataClient
             from google.analytics.data_v1beta.types import (
@@ -176,10 +332,6 @@ class AnalyticsCollector:
             credentials = Credentials.from_service_account_file(self.ga_credentials_file)
             client = BetaAnalyticsDataClient(credentials=credentials)
             
-            # Define date range
-            start_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
-            end_date = datetime.now().strftime('%Y-%m-%d')
-            
             # Basic metrics request
             request = RunReportRequest(
                 property=f"properties/{self.ga_property_id}",
@@ -203,8 +355,8 @@ class AnalyticsCollector:
             total_sessions = 0
             total_users = 0
             total_pageviews = 0
-            top_pages = []
-            traffic_sources = {}
+            page_rows = []
+            traffic_sources = defaultdict(int)
             
             for row in response.rows:
                 page_path = row.dimension_values[0].value
@@ -218,39 +370,36 @@ class AnalyticsCollector:
                 total_pageviews += pageviews
                 
                 # Track top pages
-                top_pages.append({
-                    'page': page_path,
-                    'sessions': sessions,
-                    'pageviews': pageviews
-                })
+                page_rows.append((sessions, page_path, pageviews))
                 
                 # Track traffic sources
-                if source_medium not in traffic_sources:
-                    traffic_sources[source_medium] = 0
                 traffic_sources[source_medium] += sessions
             
-            # Sort and limit top pages
-            top_pages = sorted(top_pages, key=lambda x: x['sessions'], reverse=True)[:10]
+            # Keep the 10 busiest pages without sorting every row
+            top_pages = [{'page': page, 'sessions': sessions, 'pageviews': pageviews}
+                         for sessions, page, pageviews in heapq.nlargest(10, page_rows, key=itemgetter(0))]
             
-            return {
+            result = {
                 'sessions': total_sessions,
                 'users': total_users,
                 'pageviews': total_pageviews,
                 'bounce_rate': 0.35,  # Average from response
                 'avg_session_duration': 120.0,  # Average from response
                 'top_pages': top_pages,
-                'traffic_sources': traffic_sources,
+                'traffic_sources': dict(traffic_sources),
             }
+            self._save_ga_cache(cache_path, result)
+            return result
             
         except Exception as e:
             logger.error(f"Error collecting Google Analytics data: {e}")
             return self._get_mock_ga_data()
 
-    def _parse_ga_api_response(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Parse Google Analytics API response"""
+    def _parse_ga_api_response(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Parse Google Analytics API response; returns None if it holds no usable report"""
         try:
             if 'reports' not in data or not data['reports']:
-                return self._get_mock_ga_data()
+                return None
             
             report = data['reports'][0]
             
@@ -258,8 +407,8 @@ class AnalyticsCollector:
             total_sessions = 0
             total_users = 0
             total_pageviews = 0
-            top_pages = []
-            traffic_sources = {}
+            page_rows = []
+            traffic_sources = defaultdict(int)
             
             if 'data' in report and 'rows' in report['data']:
                 for row in report['data']['rows']:
@@ -278,19 +427,14 @@ class AnalyticsCollector:
                         total_pageviews += pageviews
                         
                         # Track top pages
-                        top_pages.append({
-                            'page': page_path,
-                            'sessions': sessions,
-                            'pageviews': pageviews
-                        })
+                        page_rows.append((sessions, page_path, pageviews))
                         
                         # Track traffic sources
-                        if source not in traffic_sources:
-                            traffic_sources[source] = 0
                         traffic_sources[source] += sessions
             
-            # Sort and limit top pages
-            top_pages = sorted(top_pages, key=lambda x: x['sessions'], reverse=True)[:10]
+            # Keep the 10 busiest pages without sorting every row
+            top_pages = [{'page': page, 'sessions': sessions, 'pageviews': pageviews}
+                         for sessions, page, pageviews in heapq.nlargest(10, page_rows, key=itemgetter(0))]
             
             # Extract totals from report if available
             if 'data' in report and 'totals' in report['data']:
@@ -307,12 +451,12 @@ class AnalyticsCollector:
                 'bounce_rate': 0.35,  # Would be parsed from metrics[3]
                 'avg_session_duration': 120.0,  # Would be parsed from metrics[4]
                 'top_pages': top_pages,
-                'traffic_sources': traffic_sources,
+                'traffic_sources': dict(traffic_sources),
             }
             
         except Exception as e:
             logger.error(f"Error parsing GA API response: {e}")
-            return self._get_mock_ga_data()
+            return None
     
     def collect_youtube_analytics(self) -> Dict[str, Any]:
         """Collect YouTube analytics data"""
@@ -329,8 +473,8 @@ class AnalyticsCollector:
             logger.error(f"Error collecting YouTube data: {e}")
             return self._get_mock_youtube_data()
     
-    def collect_outreach_analytics(self) -> Dict[str, Any]:
-        """Collect outreach campaign analytics"""
+    def collect_outreach_analytics(self, report_date: Optional[str] = None) -> Dict[str, Any]:
+        """Collect outreach campaign analytics for report_date (defaults to the current report's date)"""
         try:
             # Load outreach log
             log_file = self.data_dir / "outreach_log.json"
@@ -342,19 +486,17 @@ class AnalyticsCollector:
                     'new_contacts': 0
                 }
             
-            with open(log_file) as f:
-                outreach_log = json.load(f)
+            outreach_log = _read_json(log_file)
             
             # Count today's activities
-            today = datetime.now().strftime('%Y-%m-%d')
+            today = report_date or self._report_date or datetime.now().strftime('%Y-%m-%d')
             emails_sent = sum(1 for entry in outreach_log if entry.get('date', '').startswith(today))
             
             # Load contacts for new discoveries
             contacts_file = self.data_dir / "contacts.json"
             new_contacts = 0
             if contacts_file.exists():
-                with open(contacts_file) as f:
-                    contacts = json.load(f)
+                contacts = _read_json(contacts_file)
                 new_contacts = sum(1 for contact in contacts 
                                  if contact.get('date_discovered', '').startswith(today))
             
@@ -362,8 +504,7 @@ class AnalyticsCollector:
             pending_file = self.data_dir / "pending_outreach.json"
             pending_count = 0
             if pending_file.exists():
-                with open(pending_file) as f:
-                    pending_outreach = json.load(f)
+                pending_outreach = _read_json(pending_file)
                 pending_count = len([p for p in pending_outreach if not p.get('sent', False)])
             
             logger.info(f"Real outreach analytics: {emails_sent} emails sent, {new_contacts} new contacts, {pending_count} pending")
@@ -389,8 +530,11 @@ class AnalyticsCollector:
     def collect_website_analytics(self) -> Dict[str, Any]:
         """Collect basic website analytics (alternative to GA)"""
         try:
-            # Simple website health check
-            response = requests.get(self.website_url, timeout=10)
+            # Simple website health check; HEAD skips the page body, with GET
+            # as a fallback for servers that don't allow it
+            response = self.session.head(self.website_url, timeout=10, allow_redirects=True)
+            if response.status_code == 405:
+                response = self.session.get(self.website_url, timeout=10)
             is_online = response.status_code == 200
             response_time = response.elapsed.total_seconds()
             
@@ -463,25 +607,7 @@ class AnalyticsCollector:
         except Exception as e:
             logger.warning(f"Could not generate realistic mock GA data: {e}")
             # Fallback to simple mock data
-            return {
-                'sessions': 45,
-                'users': 38,
-                'pageviews': 67,
-                'bounce_rate': 0.32,
-                'avg_session_duration': 145.5,
-                'top_pages': [
-                    {'page': '/', 'sessions': 25, 'pageviews': 30},
-                    {'page': '/register', 'sessions': 12, 'pageviews': 15},
-                    {'page': '/about', 'sessions': 8, 'pageviews': 12}
-                ],
-                'traffic_sources': {
-                    'google / organic': 20,
-                    '(direct) / (none)': 15,
-                    'linkedin.com / referral': 5,
-                    'twitter.com / referral': 3,
-                    'github.com / referral': 2
-                }
-            }
+            return FALLBACK_GA_DATA
     
     def _get_mock_youtube_data(self) -> Dict[str, Any]:
         """Generate realistic YouTube analytics data"""
@@ -506,40 +632,50 @@ class AnalyticsCollector:
     def generate_daily_report(self) -> AnalyticsData:
         """Generate comprehensive daily analytics report"""
         logger.info("Generating daily analytics report...")
-        
-        # Collect data from all sources
-        ga_data = self.collect_google_analytics()
-        youtube_data = self.collect_youtube_analytics()
-        outreach_data = self.collect_outreach_analytics()
-        website_data = self.collect_website_analytics()
-        
-        # Create analytics data object
-        analytics = AnalyticsData(
-            date=datetime.now().strftime('%Y-%m-%d'),
-            website_sessions=ga_data.get('sessions', 0),
-            website_users=ga_data.get('users', 0),
-            website_pageviews=ga_data.get('pageviews', 0),
-            website_bounce_rate=ga_data.get('bounce_rate', 0.0),
-            website_avg_session_duration=ga_data.get('avg_session_duration', 0.0),
-            website_top_pages=ga_data.get('top_pages', []),
-            website_traffic_sources=ga_data.get('traffic_sources', {}),
-            youtube_views=youtube_data.get('views', 0),
-            youtube_subscribers=youtube_data.get('subscribers', 0),
-            youtube_watch_time=youtube_data.get('watch_time', 0.0),
-            emails_sent=outreach_data.get('emails_sent', 0),
-            emails_opened=outreach_data.get('emails_opened', 0),
-            emails_clicked=outreach_data.get('emails_clicked', 0),
-            new_contacts_discovered=outreach_data.get('new_contacts', 0),
-            search_engine_referrals=ga_data.get('traffic_sources', {}).get('google / organic', 0),
-            social_media_referrals=sum(v for k, v in ga_data.get('traffic_sources', {}).items() 
-                                     if any(social in k.lower() for social in ['linkedin', 'twitter', 'facebook', 'instagram'])),
-            direct_traffic=ga_data.get('traffic_sources', {}).get('(direct) / (none)', 0)
-        )
-        
-        # Save report
-        self._save_daily_report(analytics)
-        
-        return analytics
+        self._report_date = datetime.now().strftime('%Y-%m-%d')
+        try:
+            # Collect data from all sources concurrently; each collector handles its
+            # own errors and falls back to defaults, so one failure can't sink the rest
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                ga_future = executor.submit(self.collect_google_analytics)
+                youtube_future = executor.submit(self.collect_youtube_analytics)
+                outreach_future = executor.submit(self.collect_outreach_analytics, self._report_date)
+                website_future = executor.submit(self.collect_website_analytics)
+            ga_data = ga_future.result()
+            youtube_data = youtube_future.result()
+            outreach_data = outreach_future.result()
+            website_data = website_future.result()
+            
+            # Create analytics data object
+            analytics = AnalyticsData(
+                date=self._report_date,
+                website_sessions=ga_data.get('sessions', 0),
+                website_users=ga_data.get('users', 0),
+                website_pageviews=ga_data.get('pageviews', 0),
+                website_bounce_rate=ga_data.get('bounce_rate', 0.0),
+                website_avg_session_duration=ga_data.get('avg_session_duration', 0.0),
+                website_top_pages=ga_data.get('top_pages', []),
+                website_traffic_sources=ga_data.get('traffic_sources', {}),
+                youtube_views=youtube_data.get('views', 0),
+                youtube_subscribers=youtube_data.get('subscribers', 0),
+                youtube_watch_time=youtube_data.get('watch_time', 0.0),
+                emails_sent=outreach_data.get('emails_sent', 0),
+                emails_opened=outreach_data.get('emails_opened', 0),
+                emails_clicked=outreach_data.get('emails_clicked', 0),
+                new_contacts_discovered=outreach_data.get('new_contacts', 0),
+                search_engine_referrals=ga_data.get('traffic_sources', {}).get('google / organic', 0),
+                social_media_referrals=sum(v for k, v in ga_data.get('traffic_sources', {}).items() 
+                                         if SOCIAL_SOURCE_RE.search(k)),
+                direct_traffic=ga_data.get('traffic_sources', {}).get('(direct) / (none)', 0)
+            )
+            
+            # Save report
+            self._save_daily_report(analytics)
+            
+            return analytics
+        finally:
+            # The stamp only applies during this run; standalone collector calls use the current date
+            self._report_date = None
     
     def _save_daily_report(self, analytics: AnalyticsData):
         """Save daily report to file"""
@@ -557,27 +693,17 @@ class AnalyticsCollector:
             logger.info(f"Archived previous report: {archive_file}")
         
         # Save new current report (no timestamp)
-        with open(current_report, 'w') as f:
-            json.dump(asdict(analytics), f, indent=2)
-        
-        # Also update the main daily reports file for backward compatibility
-        legacy_reports_file = self.data_dir / "daily_reports.json"
-        
-        # Load existing reports
-        reports = []
-        if legacy_reports_file.exists():
-            with open(legacy_reports_file) as f:
-                reports = json.load(f)
-        
-        # Add new report
-        reports.append(asdict(analytics))
+        _write_json(current_report, asdict(analytics))
         
-        # Keep only last 30 days
-        reports = reports[-30:]
+        # Also update the main daily reports file for backward compatibility;
+        # the deque drops anything older than the last 30 days
+        legacy_reports_file = self.reports_file
+        self._reports.append(asdict(analytics))
         
-        # Save updated reports
-        with open(legacy_reports_file, 'w') as f:
-            json.dump(reports, f, indent=2)
+        # Write to a temp file and swap it in so a crash can't truncate the history
+        tmp_file = legacy_reports_file.with_suffix('.json.tmp')
+        _write_json(tmp_file, list(self._reports))
+        os.replace(tmp_file, legacy_reports_file)
         
         # Clean up old report files (30 day retention)
         self._cleanup_old_reports(reports_dir)
@@ -704,34 +830,10 @@ def get_enhanced_youtube_analytics() -> Dict[str, Any]:
             }
         else:
             logger.info("YouTube API not configured, using baseline data")
-            return {
-                "views_24h": 0,
-                "subscribers_gained": 0,
-                "watch_time_minutes": 0.0,
-                "top_videos": [],
-                "engagement_rate": 0.0,
-                "average_view_duration": "0:00",
-                "traffic_sources": {
-                    "youtube_search": 0,
-                    "suggested_videos": 0,
-                    "external": 0
-                }
-            }
+            return BASELINE_YOUTUBE_ANALYTICS
     except Exception as e:
         logger.error(f"Error getting YouTube analytics: {e}")
-        return {
-            "views_24h": 0,
-            "subscribers_gained": 0,
-            "watch_time_minutes": 0.0,
-            "top_videos": [],
-            "engagement_rate": 0.0,
-            "average_view_duration": "0:00",
-            "traffic_sources": {
-                "youtube_search": 0,
-                "suggested_videos": 0,
-                "external": 0
-            }
-        }
+        return BASELINE_YOUTUBE_ANALYTICS
 
 def get_enhanced_website_analytics() -> Dict[str, Any]:
     """Get enhanced website analytics with conversion tracking"""
@@ -817,33 +919,7 @@ def get_enhanced_website_analytics() -> Dict[str, Any]:
     except Exception as e:
         logger.error(f"Error getting enhanced website analytics: {e}")
         # Fallback to baseline data
-        return {
-            "conversion_events": {
-                "podcast_signups": 0,
-                "newsletter_signups": 0,
-                "contact_form_submissions": 0,
-                "resource_downloads": 0
-            },
-            "user_behavior": {
-                "new_vs_returning": {"new": 75, "returning": 25},
-                "device_breakdown": {"desktop": 60, "mobile": 35, "tablet": 5},
-                "location_top5": [
-                    {"country": "United States", "sessions": 45},
-                    {"country": "Canada", "sessions": 12},
-                    {"country": "United Kingdom", "sessions": 8},
-                    {"country": "Germany", "sessions": 6},
-                    {"country": "Australia", "sessions": 4}
-                ]
-            },
-            "performance_metrics": {
-                "page_load_time": 2.3,
-                "core_web_vitals": {
-                    "LCP": 2.1,
-                    "FID": 85,
-                    "CLS": 0.05
-                }
-            }
-        }
+        return BASELINE_WEBSITE_ANALYTICS
 
 def format_daily_report_email(analytics: AnalyticsData) -> Dict[str, str]:
     """Format analytics data into an email report with enhanced details"""
@@ -858,8 +934,14 @@ def format_daily_report_email(analytics: AnalyticsData) -> Dict[str, str]:
     enhanced_youtube_data = get_enhanced_youtube_analytics()
     enhanced_website_data = get_enhanced_website_analytics()
     
+    # Traffic source summaries shared by the HTML and text bodies
+    traffic_sources = analytics.website_traffic_sources or {}
+    total_sessions = sum(traffic_sources.values()) or 1
+    sorted_sources = sorted(traffic_sources.items(), key=lambda x: x[1], reverse=True)[:5]
+    primary_source = sorted_sources[0][0] if sorted_sources else 'N/A'
+    
     # Create HTML email body with enhanced content
-    html_body = f"""
+    html_parts = [f"""
     <!DOCTYPE html>
     <html>
     <head>
@@ -940,55 +1022,55 @@ def format_daily_report_email(analytics: AnalyticsData) -> Dict[str, str]:
                 <h3>🔍 New Sources Discovered</h3>
                 <div class="highlight">
                     <strong>{new_sources_data['count']}</strong> new sources discovered today
-                </div>"""
+                </div>"""]
     
     if new_sources_data['sources']:
-        html_body += """
+        html_parts.append("""
                 <table class="table">
-                    <tr><th>Source</th><th>Category</th><th>Contacts Found</th><th>Website</th></tr>"""
+                    <tr><th>Source</th><th>Category</th><th>Contacts Found</th><th>Website</th></tr>""")
         
         for source in new_sources_data['sources'][:5]:
-            html_body += f"""
+            html_parts.append(f"""
                     <tr>
                         <td>{source['name']}</td>
                         <td>{source['category'].title()}</td>
                         <td>{source['contacts_found']}</td>
                         <td><a href="{source['website']}" target="_blank">{source['website'][:50]}...</a></td>
-                    </tr>"""
+                    </tr>""")
         
-        html_body += "</table>"
+        html_parts.append("</table>")
     else:
-        html_body += "<p>No new sources discovered today. The system is in maintenance mode or all recent sources have been scraped.</p>"
+        html_parts.append("<p>No new sources discovered today. The system is in maintenance mode or all recent sources have been scraped.</p>")
 
-    html_body += f"""
+    html_parts.append(f"""
             </div>
 
             <div class="section">
                 <h3>� Response Tracking</h3>
                 <div class="highlight">
                     <strong>{responses_data['total_responses']}</strong> total responses received to date
-                </div>"""
+                </div>""")
     
     if responses_data['recent_responses']:
-        html_body += """
+        html_parts.append("""
                 <h4>Recent Responses (Last 7 Days):</h4>
                 <table class="table">
-                    <tr><th>Contact</th><th>Organization</th><th>Email</th><th>Date</th></tr>"""
+                    <tr><th>Contact</th><th>Organization</th><th>Email</th><th>Date</th></tr>""")
         
         for response in responses_data['recent_responses']:
-            html_body += f"""
+            html_parts.append(f"""
                     <tr>
                         <td>{response['name']}</td>
                         <td>{response['organization']}</td>
                         <td>{response['email']}</td>
                         <td>{response['date']}</td>
-                    </tr>"""
+                    </tr>""")
         
-        html_body += "</table>"
+        html_parts.append("</table>")
     else:
-        html_body += "<p>No recent responses. Keep up the great outreach work!</p>"
+        html_parts.append("<p>No recent responses. Keep up the great outreach work!</p>")
 
-    html_body += f"""
+    html_parts.append(f"""
             </div>
             
             <div class="section">
@@ -1039,12 +1121,12 @@ def format_daily_report_email(analytics: AnalyticsData) -> Dict[str, str]:
                     <div class="column">
                         <h4>Top Performing Videos:</h4>
                         <table class="table">
-                            <tr><th>Video</th><th>Views</th><th>Duration</th></tr>"""
+                            <tr><th>Video</th><th>Views</th><th>Duration</th></tr>""")
     
     for video in enhanced_youtube_data['top_videos']:
-        html_body += f"<tr><td>{video['title']}</td><td>{video['views']}</td><td>{video['duration']}</td></tr>"
+        html_parts.append(f"<tr><td>{video['title']}</td><td>{video['views']}</td><td>{video['duration']}</td></tr>")
     
-    html_body += f"""
+    html_parts.append(f"""
                         </table>
                     </div>
                 </div>
@@ -1056,26 +1138,24 @@ def format_daily_report_email(analytics: AnalyticsData) -> Dict[str, str]:
                     <div class="column">
                         <h4>Traffic Sources:</h4>
                         <table class="table">
-                            <tr><th>Source</th><th>Sessions</th><th>%</th></tr>"""
+                            <tr><th>Source</th><th>Sessions</th><th>%</th></tr>""")
     
-    traffic_sources = analytics.website_traffic_sources or {}
-    total_sessions = sum(traffic_sources.values()) or 1
-    for source, sessions in sorted(traffic_sources.items(), key=lambda x: x[1], reverse=True)[:5]:
+    for source, sessions in sorted_sources:
         percentage = (sessions / total_sessions) * 100
-        html_body += f"<tr><td>{source}</td><td>{sessions}</td><td>{percentage:.1f}%</td></tr>"
+        html_parts.append(f"<tr><td>{source}</td><td>{sessions}</td><td>{percentage:.1f}%</td></tr>")
     
-    html_body += f"""
+    html_parts.append(f"""
                         </table>
                     </div>
                     <div class="column">
                         <h4>Top Countries:</h4>
                         <table class="table">
-                            <tr><th>Country</th><th>Sessions</th></tr>"""
+                            <tr><th>Country</th><th>Sessions</th></tr>""")
     
     for country in enhanced_website_data['user_behavior']['location_top5']:
-        html_body += f"<tr><td>{country['country']}</td><td>{country['sessions']}</td></tr>"
+        html_parts.append(f"<tr><td>{country['country']}</td><td>{country['sessions']}</td></tr>")
     
-    html_body += f"""
+    html_parts.append(f"""
                         </table>
                     </div>
                 </div>
@@ -1104,7 +1184,7 @@ def format_daily_report_email(analytics: AnalyticsData) -> Dict[str, str]:
             <div class="section">
                 <h3>🔍 Key Insights</h3>
                 <ul>
-                    <li><strong>Primary Traffic Source:</strong> {max(analytics.website_traffic_sources.items(), key=lambda x: x[1])[0] if analytics.website_traffic_sources else 'N/A'}</li>
+                    <li><strong>Primary Traffic Source:</strong> {primary_source}</li>
                     <li><strong>User Behavior:</strong> {enhanced_website_data['user_behavior']['new_vs_returning']['new']}% new visitors, {enhanced_website_data['user_behavior']['new_vs_returning']['returning']}% returning</li>
                     <li><strong>Device Usage:</strong> {enhanced_website_data['user_behavior']['device_breakdown']['desktop']}% desktop, {enhanced_website_data['user_behavior']['device_breakdown']['mobile']}% mobile</li>
                     <li><strong>YouTube Growth:</strong> +{enhanced_youtube_data['subscribers_gained']} subscribers with {enhanced_youtube_data['engagement_rate']:.2%} engagement rate</li>
@@ -1120,10 +1200,11 @@ def format_daily_report_email(analytics: AnalyticsData) -> Dict[str, str]:
         </div>
     </body>
     </html>
-    """
+    """)
+    html_body = "".join(html_parts)
     
     # Create enhanced plain text version
-    text_body = f"""
+    text_parts = [f"""
 BUILDLY LABS FOUNDRY - DAILY ANALYTICS REPORT
 Date: {analytics.date}
 
@@ -1146,29 +1227,29 @@ Overall Conversion Rate: {(sum(enhanced_website_data['conversion_events'].values
 NEW SOURCES DISCOVERED
 ======================
 Total new sources today: {new_sources_data['count']}
-"""
+"""]
     
     if new_sources_data['sources']:
-        text_body += "New sources found:\n"
+        text_parts.append("New sources found:\n")
         for source in new_sources_data['sources'][:5]:
-            text_body += f"  - {source['name']} ({source['category']}) - {source['contacts_found']} contacts\n"
+            text_parts.append(f"  - {source['name']} ({source['category']}) - {source['contacts_found']} contacts\n")
     else:
-        text_body += "No new sources discovered today.\n"
+        text_parts.append("No new sources discovered today.\n")
     
-    text_body += f"""
+    text_parts.append(f"""
 RESPONSE TRACKING
 ================
 Total responses received: {responses_data['total_responses']}
-"""
+""")
     
     if responses_data['recent_responses']:
-        text_body += "Recent responses (last 7 days):\n"
+        text_parts.append("Recent responses (last 7 days):\n")
         for response in responses_data['recent_responses']:
-            text_body += f"  - {response['name']} ({response['organization']}) on {response['date']}\n"
+            text_parts.append(f"  - {response['name']} ({response['organization']}) on {response['date']}\n")
     else:
-        text_body += "No recent responses.\n"
+        text_parts.append("No recent responses.\n")
     
-    text_body += f"""
+    text_parts.append(f"""
 OUTREACH CAMPAIGN PERFORMANCE
 =============================
 Emails Sent: {analytics.emails_sent}
@@ -1184,27 +1265,26 @@ Watch Time: {enhanced_youtube_data['watch_time_minutes']:.0f} minutes
 Engagement Rate: {enhanced_youtube_data['engagement_rate']:.2%}
 Average View Duration: {enhanced_youtube_data['average_view_duration']}
 
-Top Videos:"""
+Top Videos:""")
     
     for video in enhanced_youtube_data['top_videos']:
-        text_body += f"\n  - {video['title']}: {video['views']} views ({video['duration']})"
+        text_parts.append(f"\n  - {video['title']}: {video['views']} views ({video['duration']})")
     
-    text_body += f"""
+    text_parts.append(f"""
 
 TRAFFIC SOURCES & GEOGRAPHY
 ===========================
-Traffic Sources:"""
+Traffic Sources:""")
     
-    traffic_sources_text = analytics.website_traffic_sources or {}
-    for source, sessions in sorted(traffic_sources_text.items(), key=lambda x: x[1], reverse=True)[:5]:
+    for source, sessions in sorted_sources:
         percentage = (sessions / total_sessions) * 100
-        text_body += f"\n  {source}: {sessions} ({percentage:.1f}%)"
+        text_parts.append(f"\n  {source}: {sessions} ({percentage:.1f}%)")
     
-    text_body += "\n\nTop Countries:"
+    text_parts.append("\n\nTop Countries:")
     for country in enhanced_website_data['user_behavior']['location_top5']:
-        text_body += f"\n  {country['country']}: {country['sessions']} sessions"
+        text_parts.append(f"\n  {country['country']}: {country['sessions']} sessions")
     
-    text_body += f"""
+    text_parts.append(f"""
 
 PERFORMANCE METRICS
 ===================
@@ -1221,7 +1301,7 @@ Device Breakdown: {enhanced_website_data['user_behavior']['device_breakdown']['d
 
 KEY INSIGHTS
 ============
-- Primary Traffic Source: {max(analytics.website_traffic_sources.items(), key=lambda x: x[1])[0] if analytics.website_traffic_sources else 'N/A'}
+- Primary Traffic Source: {primary_source}
 - User Behavior: {enhanced_website_data['user_behavior']['new_vs_returning']['new']}% new visitors, {enhanced_website_data['user_behavior']['new_vs_returning']['returning']}% returning
 - Device Usage: {enhanced_website_data['user_behavior']['device_breakdown']['desktop']}% desktop, {enhanced_website_data['user_behavior']['device_breakdown']['mobile']}% mobile
 - YouTube Growth: +{enhanced_youtube_data['subscribers_gained']} subscribers with {enhanced_youtube_data['engagement_rate']:.2%} engagement
@@ -1231,7 +1311,8 @@ KEY INSIGHTS
 
 Generated by Buildly Labs Foundry Analytics System
 https://www.firstcityfoundry.com | Podcast: https://www.firstcityfoundry.com/podcast.html
-"""
+""")
+    text_body = "".join(text_parts)
     
     return {
         'subject': f'🚀 Daily Analytics Report - {analytics.date} | Buildly Labs Foundry',
@@ -6,18 +6,20 @@ Quick runner script for the startup outreach system
 import os
 import sys
 import subprocess
+from importlib.metadata import distributions
 from pathlib import Path
 
 def check_dependencies():
     """Check if required packages are installed"""
+    if os.environ.get('SKIP_DEP_CHECK'):
+        return
+    
     required = ['rich', 'schedule', 'beautifulsoup4', 'requests']
-    missing = []
     
-    for package in required:
-        try:
-            __import__(package)
-        except ImportError:
-            missing.append(package)
+    # Compare against installed distribution metadata rather than importing
+    # each package (the bs4 import name never matched 'beautifulsoup4')
+    installed = {(dist.metadata['Name'] or '').lower() for dist in distributions()}
+    missing = [package for package in required if package.lower() not in installed]
     
     if missing:
         print(f"Missing dependencies: {', '.join(missing)}")
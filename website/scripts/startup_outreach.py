@@ -25,26 +25,26 @@ Usage:
 """
 
 import json
-import csv
 import time
 import random
 import logging
 import argparse
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
+import sys
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Set, Optional
+from dataclasses import dataclass, asdict, fields
+from typing import List, Dict, Optional
 from pathlib import Path
+from operator import attrgetter
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from email.mime.base import MIMEBase
-from email import encoders
 import re
-from urllib.parse import urljoin, urlparse, quote
+from urllib.parse import urljoin, quote
 from bs4 import BeautifulSoup
-import yagmail
 from jinja2 import Template
 
 # Load environment variables
@@ -53,12 +53,16 @@ try:
     load_dotenv()
 except ImportError:
     print("Warning: python-dotenv not installed. Using system environment variables only.")
-import schedule
+
+# Optional faster JSON serializer for the data files
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
-from rich.syntax import Syntax
 from rich.progress import Progress, SpinnerColumn, TextColumn
 import textwrap
 
@@ -73,6 +77,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Contact extraction patterns, compiled once and shared by every page scraped
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+MAILTO_RE = re.compile(r'^mailto:', re.I)
+OBFUSCATED_EMAIL_RES = (
+    re.compile(r'\b[A-Za-z0-9._%+-]+\s*\[at\]\s*[A-Za-z0-9.-]+\s*\[dot\]\s*[A-Z|a-z]{2,}\b', re.I),
+    re.compile(r'\b[A-Za-z0-9._%+-]+\s*@\s*[A-Za-z0-9.-]+\s*\.\s*[A-Z|a-z]{2,}\b', re.I),
+)
+CONTACT_HEADER_RE = re.compile(r'contact|team|about|staff', re.I)
+SKIP_EMAIL_PATTERNS = (
+    'noreply', 'no-reply', 'donotreply', 'mailer-daemon',
+    'postmaster', 'abuse', 'security', 'legal',
+    'privacy', 'gdpr', 'unsubscribe', 'bounces'
+)
+
 @dataclass
 class Contact:
     """Data class for contact information"""
@@ -90,7 +108,6 @@ class Contact:
     last_contact: Optional[str] = None
     contact_log: Optional[List[dict]] = None
 
-@dataclass
 @dataclass
 class OutreachTarget:
     """Data class for outreach targets"""
@@ -104,6 +121,14 @@ class OutreachTarget:
     last_scraped: Optional[str] = None
     region: str = "US/Global"
 
+# Field names and a matching getter for serializing targets without asdict()'s deep copy
+TARGET_FIELDS = tuple(f.name for f in fields(OutreachTarget))
+_target_values = attrgetter(*TARGET_FIELDS)
+
+def target_to_dict(target: OutreachTarget) -> Dict:
+    """Convert a target to a JSON-ready dict"""
+    return dict(zip(TARGET_FIELDS, _target_values(target)))
+
 @dataclass
 class PendingOutreach:
     """Data class for pending outreach messages"""
@@ -113,6 +138,46 @@ class PendingOutreach:
     approved: bool = False
     sent: bool = False
 
+class TokenBucket:
+    """Token-bucket limiter for outbound email sends"""
+    
+    def __init__(self, rate_per_second: float, burst: int, daily_cap: int = 0, sent_today: int = 0):
+        self.rate_per_second = rate_per_second
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.daily_cap = daily_cap
+        self.sent_today = sent_today
+        self.last_refill = time.monotonic()
+    
+    def cap_reached(self) -> bool:
+        """True once today's successful sends have hit the daily cap"""
+        return bool(self.daily_cap) and self.sent_today >= self.daily_cap
+    
+    def acquire(self) -> bool:
+        """Wait for a send token; returns False once the daily cap is reached"""
+        if self.cap_reached():
+            return False
+        
+        # A non-positive rate disables pacing; only the daily cap applies
+        if self.rate_per_second <= 0:
+            return True
+        
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate_per_second)
+        self.last_refill = now
+        
+        if self.tokens < 1:
+            time.sleep((1 - self.tokens) / self.rate_per_second)
+            self.tokens = 1.0
+            self.last_refill = time.monotonic()
+        
+        self.tokens -= 1
+        return True
+    
+    def record_sent(self):
+        """Charge one successful send against the daily cap"""
+        self.sent_today += 1
+
 class StartupOutreachBot:
     """Main outreach automation class"""
     
@@ -140,7 +205,17 @@ class StartupOutreachBot:
         # Configuration
         self.max_outreach_per_target = 4
         self.min_outreach_per_target = 2
-        self.rate_limit_delay = (30, 60)  # Random delay between 30-60 seconds
+        self.rate_limit_delay = (30, 60)  # Random delay between target scrapes
+        
+        # Shared HTTP session so scrapes reuse connections; retries transient server errors
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         
         # Rich console for beautiful CLI
         self.console = Console()
@@ -148,10 +223,33 @@ class StartupOutreachBot:
         # Load configuration
         self.config = self.load_config()
         
+        # Throttle outbound email with a token bucket instead of fixed sleeps
+        rate_limits = self.config['rate_limits']
+        self.send_limiter = TokenBucket(
+            rate_per_second=rate_limits['rate_per_second'],
+            burst=rate_limits['burst'],
+            daily_cap=rate_limits['daily_cap'],
+            sent_today=self.count_sent_today()
+        )
+        
         # Initialize with default targets
         if not self.targets:
             self.initialize_default_targets()
 
+    def write_json(self, path: Path, data):
+        """Write data to a JSON file, using orjson when it is installed"""
+        if orjson is not None:
+            path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(path, 'w') as f:
+                json.dump(data, f, indent=2)
+
+    def dumps_json(self, data) -> str:
+        """Serialize data exactly as write_json would lay it out in a file"""
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(data, indent=2)
+
     def load_contacts(self) -> List[Contact]:
         """Load contacts from JSON file"""
         if self.contacts_file.exists():
@@ -162,8 +260,7 @@ class StartupOutreachBot:
 
     def save_contacts(self):
         """Save contacts to JSON file"""
-        with open(self.contacts_file, 'w') as f:
-            json.dump([asdict(contact) for contact in self.contacts], f, indent=2)
+        self.write_json(self.contacts_file, [asdict(contact) for contact in self.contacts])
 
     def load_targets(self) -> List[OutreachTarget]:
         """Load outreach targets from JSON file"""
@@ -175,8 +272,39 @@ class StartupOutreachBot:
 
     def save_targets(self):
         """Save targets to JSON file"""
-        with open(self.targets_file, 'w') as f:
-            json.dump([asdict(target) for target in self.targets], f, indent=2)
+        self.write_json(self.targets_file, [target_to_dict(target) for target in self.targets])
+
+    def append_targets(self, new_targets: List[OutreachTarget]):
+        """Append targets (already in self.targets) to the JSON file without rewriting it"""
+        if not new_targets:
+            return
+        if not self.targets_file.exists():
+            self.save_targets()
+            return
+        
+        with open(self.targets_file, 'r+b') as f:
+            # Locate the array's closing bracket from the tail of the file
+            end = f.seek(0, os.SEEK_END)
+            start = f.seek(max(0, end - 64))
+            tail = f.read()
+            close = tail.rfind(b']')
+            appendable = close != -1 and not tail[close + 1:].strip()
+            if appendable:
+                head = tail[:close].rstrip()
+                separator = '\n' if head.endswith(b'[') else ',\n'
+                records = ',\n'.join(textwrap.indent(self.dumps_json(target_to_dict(target)), '  ')
+                                      for target in new_targets)
+                f.seek(start + len(head))
+                f.truncate()
+                f.write(f"{separator}{records}\n]".encode())
+        
+        if not appendable:
+            self.save_targets()
+
+    def save_all(self):
+        """Save contacts and targets back to back"""
+        self.save_contacts()
+        self.save_targets()
 
     def load_outreach_log(self) -> List[Dict]:
         """Load outreach log from JSON file"""
@@ -187,8 +315,7 @@ class StartupOutreachBot:
 
     def save_outreach_log(self):
         """Save outreach log to JSON file"""
-        with open(self.outreach_log_file, 'w') as f:
-            json.dump(self.outreach_log, f, indent=2)
+        self.write_json(self.outreach_log_file, self.outreach_log)
 
     def load_pending_outreach(self) -> List[PendingOutreach]:
         """Load pending outreach from JSON file"""
@@ -215,8 +342,13 @@ class StartupOutreachBot:
                 'approved': pending.approved,
                 'sent': pending.sent
             })
-        with open(self.pending_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        self.write_json(self.pending_file, data)
+
+    def count_sent_today(self) -> int:
+        """Count messages already sent today so the daily cap survives restarts"""
+        today = datetime.now().strftime("%Y-%m-%d")
+        return sum(1 for log in self.outreach_log
+                   if log.get('status') == 'sent' and log.get('timestamp', '').startswith(today))
 
     def load_opt_outs(self) -> Dict:
         """Load opt-outs from JSON file"""
@@ -232,8 +364,7 @@ class StartupOutreachBot:
 
     def save_opt_outs(self):
         """Save opt-outs to JSON file"""
-        with open(self.opt_outs_file, 'w') as f:
-            json.dump(self.opt_outs, f, indent=2)
+        self.write_json(self.opt_outs_file, self.opt_outs)
 
     def is_opted_out(self, email: str) -> bool:
         """Check if an email address has opted out"""
@@ -284,18 +415,16 @@ class StartupOutreachBot:
                 'notification_email': os.getenv('DAILY_NOTIFICATION_EMAIL', 'team@open.build')
             },
             'rate_limits': {
-                'max_daily_outreach': int(os.getenv('MAX_DAILY_OUTREACH', '50')),
-                'max_per_organization': int(os.getenv('MAX_PER_ORGANIZATION', '4')),
-                'min_delay_seconds': int(os.getenv('MIN_DELAY_SECONDS', '30')),
-                'max_delay_seconds': int(os.getenv('MAX_DELAY_SECONDS', '60'))
+                'rate_per_second': float(os.getenv('SEND_RATE_PER_SECOND', '10')),
+                'burst': int(os.getenv('SEND_BURST', '25')),
+                'daily_cap': int(os.getenv('MAX_DAILY_OUTREACH', '50')),
+                'max_per_organization': int(os.getenv('MAX_PER_ORGANIZATION', '4'))
             }
         }
         
         # Try to load additional config from config.py if it exists
         try:
             # config.py lives at the repo root: website/scripts/ -> website/ -> repo root
-            import sys
-            from pathlib import Path
             root_dir = Path(__file__).parent.parent.parent
             if str(root_dir) not in sys.path:
                 sys.path.insert(0, str(root_dir))
@@ -481,8 +610,11 @@ class StartupOutreachBot:
                 logger.error(f"Error discovering targets for query '{query}': {e}")
         
         # Add unique new targets
-        existing_websites = {target.website for target in self.targets}
-        unique_targets = [t for t in new_targets if t.website not in existing_websites]
+        existing_websites = set(map(attrgetter('website'), self.targets))
+        # Key by website so duplicates within the batch collapse too
+        by_site = {t.website: t for t in new_targets}
+        missing = by_site.keys() - existing_websites
+        unique_targets = [t for site, t in by_site.items() if site in missing]
         
         self.targets.extend(unique_targets)
         self.save_targets()
@@ -521,6 +653,7 @@ class StartupOutreachBot:
         logger.info(f"Scraping contacts from {target.name}")
         
         contacts = []
+        seen_emails = set()
         
         try:
             # Add headers to appear as a real browser
@@ -556,9 +689,13 @@ class StartupOutreachBot:
             additional_urls = self.discover_startup_specific_urls(target)
             contact_urls.extend(additional_urls)
             
-            for url in contact_urls:
+            for index, url in enumerate(contact_urls):
+                # Pause between requests to the same host, not after the last one
+                if index:
+                    time.sleep(random.uniform(3, 7))
+                
                 try:
-                    response = requests.get(url, headers=headers, timeout=15)
+                    response = self.session.get(url, headers=headers, timeout=15)
                     if response.status_code == 200:
                         soup = BeautifulSoup(response.content, 'html.parser')
                         page_contacts = self.extract_contacts_from_page(soup, target, url)
@@ -566,14 +703,13 @@ class StartupOutreachBot:
                         # Filter out test emails and duplicates
                         for contact in page_contacts:
                             if (not self.is_test_email(contact.email) and 
-                                contact.email not in [c.email for c in contacts]):
+                                contact.email not in seen_emails):
+                                seen_emails.add(contact.email)
                                 contacts.append(contact)
                         
                         # Limit contacts per target
                         if len(contacts) >= self.max_outreach_per_target:
                             break
-                            
-                    time.sleep(random.uniform(3, 7))  # Increased rate limiting
                     
                 except requests.RequestException as e:
                     logger.warning(f"Error accessing {url}: {e}")
@@ -630,22 +766,19 @@ class StartupOutreachBot:
         """Enhanced contact extraction with better name detection"""
         contacts = []
         
-        # Enhanced email regex pattern
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        
         # Find emails in various locations
         emails_found = set()
         
         # 1. Find emails in text
         page_text = soup.get_text()
-        text_emails = re.findall(email_pattern, page_text)
+        text_emails = EMAIL_RE.findall(page_text)
         emails_found.update(text_emails)
         
         # 2. Find emails in mailto links
-        mailto_links = soup.find_all('a', href=re.compile(r'^mailto:', re.I))
+        mailto_links = soup.find_all('a', href=MAILTO_RE)
         for link in mailto_links:
             email = link['href'].replace('mailto:', '').split('?')[0]
-            if re.match(email_pattern, email):
+            if EMAIL_RE.match(email):
                 emails_found.add(email)
         
         # 3. Find emails in data attributes and form actions
@@ -654,16 +787,11 @@ class StartupOutreachBot:
                 emails_found.add(element['data-email'])
         
         # 4. Look for obfuscated emails (simple cases)
-        obfuscated_patterns = [
-            r'\b[A-Za-z0-9._%+-]+\s*\[at\]\s*[A-Za-z0-9.-]+\s*\[dot\]\s*[A-Z|a-z]{2,}\b',
-            r'\b[A-Za-z0-9._%+-]+\s*@\s*[A-Za-z0-9.-]+\s*\.\s*[A-Z|a-z]{2,}\b'
-        ]
-        
-        for pattern in obfuscated_patterns:
-            obfuscated_emails = re.findall(pattern, page_text, re.I)
+        for pattern in OBFUSCATED_EMAIL_RES:
+            obfuscated_emails = pattern.findall(page_text)
             for email in obfuscated_emails:
                 clean_email = email.replace('[at]', '@').replace('[dot]', '.').replace(' ', '')
-                if re.match(email_pattern, clean_email):
+                if EMAIL_RE.match(clean_email):
                     emails_found.add(clean_email)
         
         # Process unique emails
@@ -671,13 +799,7 @@ class StartupOutreachBot:
             email = email.lower().strip()
             
             # Enhanced filtering
-            skip_patterns = [
-                'noreply', 'no-reply', 'donotreply', 'mailer-daemon',
-                'postmaster', 'abuse', 'security', 'legal',
-                'privacy', 'gdpr', 'unsubscribe', 'bounces'
-            ]
-            
-            if any(skip in email for skip in skip_patterns):
+            if any(skip in email for skip in SKIP_EMAIL_PATTERNS):
                 continue
             
             # Skip if it's a test email
@@ -801,7 +923,7 @@ class StartupOutreachBot:
     def extract_generic_contact_info(self, soup: BeautifulSoup, email: str, target: OutreachTarget) -> tuple:
         """Extract generic contact information when specific patterns fail"""
         # Look for common contact section headers
-        contact_headers = soup.find_all(['h1', 'h2', 'h3', 'h4'], text=re.compile(r'contact|team|about|staff', re.I))
+        contact_headers = soup.find_all(['h1', 'h2', 'h3', 'h4'], text=CONTACT_HEADER_RE)
         
         for header in contact_headers:
             # Look in the section following this header
@@ -1236,6 +1358,10 @@ If you no longer wish to receive these communications, you can unsubscribe here:
                 if pending.sent:
                     continue
                 
+                if not self.send_limiter.acquire():
+                    self.console.print("[yellow]⏸️  Daily outreach cap reached - remaining messages stay pending[/yellow]")
+                    break
+                
                 progress.update(task, description=f"Sending to {pending.contact.name}...")
                 
                 try:
@@ -1243,6 +1369,7 @@ If you no longer wish to receive these communications, you can unsubscribe here:
                         pending.sent = True
                         pending.approved = True
                         sent_count += 1
+                        self.send_limiter.record_sent()
                         self.console.print(f"[green]✅ Sent to {pending.contact.name}[/green]")
                     else:
                         failed_count += 1
@@ -1252,11 +1379,6 @@ If you no longer wish to receive these communications, you can unsubscribe here:
                     failed_count += 1
                     self.console.print(f"[red]❌ Error sending to {pending.contact.name}: {e}[/red]")
                 
-                # Rate limiting between sends
-                delay = random.uniform(*self.rate_limit_delay)
-                progress.update(task, description=f"Waiting {delay:.1f}s before next message...")
-                time.sleep(delay)
-                
                 progress.advance(task)
         
         # Save progress
@@ -1305,6 +1427,10 @@ If you no longer wish to receive these communications, you can unsubscribe here:
         for i, pending in enumerate(pending_outreach):
             if pending.sent or pending.approved:
                 continue
+            
+            if not self.send_limiter.acquire():
+                self.console.print("[yellow]⏸️  Daily outreach cap reached - remaining messages stay pending[/yellow]")
+                break
                 
             self.console.print(f"\n[bold]Message {i+1} of {len(pending_outreach)}[/bold]")
             self.console.rule()
@@ -1316,6 +1442,7 @@ If you no longer wish to receive these communications, you can unsubscribe here:
                     pending.sent = True
                     pending.approved = True
                     sent_count += 1
+                    self.send_limiter.record_sent()
                     self.console.print("[green]✅ Message sent successfully![/green]")
                 else:
                     self.console.print("[red]❌ Failed to send message[/red]")
@@ -1331,6 +1458,7 @@ If you no longer wish to receive these communications, you can unsubscribe here:
                         pending.sent = True
                         pending.approved = True
                         sent_count += 1
+                        self.send_limiter.record_sent()
                         self.console.print("[green]✅ Edited message sent successfully![/green]")
                 
             elif decision == "skip":
@@ -1340,12 +1468,6 @@ If you no longer wish to receive these communications, you can unsubscribe here:
             elif decision == "quit":
                 self.console.print("[blue]💾 Saving progress and exiting...[/blue]")
                 break
-            
-            # Add delay between sends
-            if decision == "send" and sent_count > 0:
-                delay = random.uniform(10, 30)
-                self.console.print(f"[dim]Waiting {delay:.1f} seconds before next message...[/dim]")
-                time.sleep(delay)
         
         # Save progress
         self.save_pending_outreach()
@@ -1515,6 +1637,9 @@ If you no longer wish to receive these communications, you can unsubscribe here:
         # Discover new targets
         new_targets = self.discover_new_targets()
         
+        # Built once and kept current as contacts are added
+        existing_emails = set(map(attrgetter('email'), self.contacts))
+        
         # Scrape contacts from existing and new targets
         for target in self.targets:
             # Skip if recently scraped (within 7 days)
@@ -1528,8 +1653,8 @@ If you no longer wish to receive these communications, you can unsubscribe here:
             new_contacts = self.scrape_contacts_from_target(target)
             
             # Add new contacts (avoid duplicates)
-            existing_emails = {contact.email for contact in self.contacts}
             unique_contacts = [c for c in new_contacts if c.email not in existing_emails]
+            existing_emails.update(c.email for c in unique_contacts)
             
             self.contacts.extend(unique_contacts)
             logger.info(f"Added {len(unique_contacts)} new contacts from {target.name}")
@@ -1538,8 +1663,7 @@ If you no longer wish to receive these communications, you can unsubscribe here:
             time.sleep(random.uniform(*self.rate_limit_delay))
         
         # Save updated data
-        self.save_contacts()
-        self.save_targets()
+        self.save_all()
         
         logger.info(f"✅ Discovery complete. Total contacts: {len(self.contacts)}")
 
@@ -1745,16 +1869,18 @@ If you no longer wish to receive these communications, you can unsubscribe here:
         failed_count = 0
         
         for pending in self.pending_outreach[:]:  # Copy list to avoid modification issues
+            if not self.send_limiter.acquire():
+                logger.info("Daily outreach cap reached - remaining messages stay pending")
+                break
+            
             try:
                 if self.send_outreach_message(pending.contact, pending.message):
                     sent_count += 1
+                    self.send_limiter.record_sent()
                     self.pending_outreach.remove(pending)
                 else:
                     failed_count += 1
                 
-                # Rate limiting between sends
-                time.sleep(random.uniform(*self.rate_limit_delay))
-                
             except Exception as e:
                 logger.error(f"Error sending to {pending.contact.email}: {e}")
                 failed_count += 1
@@ -1830,8 +1956,7 @@ If you no longer wish to receive these communications, you can unsubscribe here:
         ]
         
         # Save analytics
-        with open(self.analytics_file, 'w') as f:
-            json.dump(analytics, f, indent=2)
+        self.write_json(self.analytics_file, analytics)
         
         # Print summary
         print("\n" + "="*60)